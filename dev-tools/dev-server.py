@@ -13,18 +13,101 @@ import json
 import sys
 import os
 import threading
+import gzip
+import hashlib
 from urllib.parse import urlparse, parse_qs
 
+# Named bundles served from /bundle/<name>; files are concatenated in this order
+BUNDLE_MANIFEST = {
+    'cards.js': [
+        'components/pokemon-card-templates.js',
+        'components/browse-all-pokemon-modal.js',
+        'components/pokemon-trading-card-renderer.js',
+        'components/pokemon-card-system.js',
+        'components/pokemon-encounter-modal.js',
+        'shared-card-system.js',
+    ],
+    'services.js': [
+        'auth.js',
+        'pokemon-service.js',
+        'battle-service.js',
+        'battle-challenge-service.js',
+        'battle-simulation-service.js',
+        'catch-pokemon-service.js',
+    ],
+    'styles.css': [
+        'styles/pokemon-design-system.css',
+        'styles/pokemon-unified.css',
+        'styles/pokemon-browser.css',
+        'styles/main.css',
+    ],
+}
+
+BUNDLE_CONTENT_TYPES = {
+    'js': 'application/javascript; charset=utf-8',
+    'css': 'text/css; charset=utf-8',
+}
+
+# Built bundles keyed by (kind, ((path, mtime), ...)) - a changed file gives a new key
+_bundle_cache = {}
+_bundle_cache_lock = threading.Lock()
+
+def build_bundle(kind, files):
+    """
+    Concatenate files in order with source markers, caching by file mtimes.
+    Returns (body, gzipped_body, etag).
+    """
+    root = os.path.realpath(os.getcwd())
+    resolved = []
+    for name in files:
+        path = os.path.realpath(os.path.join(root, name))
+        # Only allow files of the bundle's type inside the project root
+        if not path.startswith(root + os.sep) or not path.endswith('.' + kind):
+            raise ValueError(f"File not allowed in {kind} bundle: {name}")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(name)
+        resolved.append((name, path))
+
+    key = (kind, tuple((name, os.path.getmtime(path)) for name, path in resolved))
+    with _bundle_cache_lock:
+        cached = _bundle_cache.get(key)
+    if cached:
+        return cached
+
+    parts = []
+    for name, path in resolved:
+        with open(path, 'rb') as f:
+            content = f.read()
+        parts.append(f"/* ===== {name} ===== */\n".encode())
+        parts.append(content)
+        # Terminate each file so a missing trailing semicolon/newline can't merge statements
+        parts.append(b"\n;\n" if kind == 'js' else b"\n")
+    body = b"".join(parts)
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    entry = (body, gzip.compress(body), etag)
+
+    with _bundle_cache_lock:
+        # Drop stale versions of the same bundle before storing the new one
+        names = tuple(name for name, _ in resolved)
+        for old_key in [k for k in _bundle_cache if k[0] == kind and tuple(n for n, _ in k[1]) == names]:
+            del _bundle_cache[old_key]
+        _bundle_cache[key] = entry
+    return entry
+
 class PokemonDevHandler(http.server.SimpleHTTPRequestHandler):
     def end_headers(self):
         # Add CORS headers for all responses
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS, PATCH')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, OData-MaxVersion, OData-Version, If-Match')
-        # Add cache control to prevent browser caching issues
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
+        if getattr(self, 'is_bundle_response', False):
+            # Bundles carry an ETag, so let the browser store them and revalidate
+            self.send_header('Cache-Control', 'no-cache')
+        else:
+            # Add cache control to prevent browser caching issues
+            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+            self.send_header('Pragma', 'no-cache')
+            self.send_header('Expires', '0')
         super().end_headers()
 
     def do_OPTIONS(self):
@@ -38,6 +121,8 @@ class PokemonDevHandler(http.server.SimpleHTTPRequestHandler):
         # Proxy API calls to Azure Functions
         if parsed_path.path.startswith('/api/'):
             self.proxy_to_azure(parsed_path)
+        elif parsed_path.path.startswith('/bundle/'):
+            self.serve_bundle(parsed_path)
         else:
             # Handle connection issues gracefully
             try:
@@ -71,6 +156,56 @@ class PokemonDevHandler(http.server.SimpleHTTPRequestHandler):
             self.send_response(405)
             self.end_headers()
     
+    def serve_bundle(self, parsed_path):
+        # /bundle/js?files=a.js,b.js  or  /bundle/css?files=...  or  /bundle/<manifest name>
+        name = parsed_path.path[len('/bundle/'):]
+        if name in BUNDLE_CONTENT_TYPES:
+            kind = name
+            files = [f for value in parse_qs(parsed_path.query).get('files', []) for f in value.split(',') if f]
+        elif name in BUNDLE_MANIFEST:
+            kind = name.rsplit('.', 1)[-1]
+            files = BUNDLE_MANIFEST[name]
+        else:
+            self.send_error(404, f"Unknown bundle: {name}")
+            return
+
+        if not files:
+            self.send_error(400, "No files specified for bundle")
+            return
+
+        try:
+            body, gzipped_body, etag = build_bundle(kind, files)
+        except FileNotFoundError as e:
+            self.send_error(404, f"Bundle file not found: {e}")
+            return
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+
+        self.is_bundle_response = True
+        try:
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            payload = gzipped_body if use_gzip else body
+            self.send_response(200)
+            self.send_header('Content-Type', BUNDLE_CONTENT_TYPES[kind])
+            self.send_header('Content-Length', str(len(payload)))
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
+            if use_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+            self.wfile.write(payload)
+        except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
+            print(f"Connection closed by client for {self.path}")
+        finally:
+            self.is_bundle_response = False
+
     def proxy_to_azure(self, parsed_path, method='GET'):
         try:
             # Check if local Azure Functions are running
@@ -159,6 +294,7 @@ def main():
     print(f"🔄 Proxying API calls to Azure Functions")
     print(f"⚡ Live reload: Just refresh your browser after changes!")
     print(f"🔧 Enhanced connection handling for multi-page architecture")
+    print(f"📦 Bundles: /bundle/js?files=..., /bundle/css?files=..., /bundle/<{', '.join(BUNDLE_MANIFEST)}>")
     print()
     
     # Use ThreadingTCPServer for better concurrent connection handling